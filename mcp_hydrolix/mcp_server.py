@@ -26,6 +26,14 @@ from mcp_hydrolix.auth import (
     UsernamePassword,
 )
 from mcp_hydrolix.mcp_env import HydrolixConfig, get_config
+from mcp_hydrolix.pagination import (
+    DEFAULT_PAGE_SIZE,
+    QueryResultCursor,
+    TableListCursor,
+    _add_pagination_to_query,
+    hash_query,
+    hash_table_filters,
+)
 from mcp_hydrolix.utils import with_serializer
 
 
@@ -472,8 +480,12 @@ async def get_table_info(database: str, table: str) -> Table:
 
 @mcp.tool()
 async def list_tables(
-    database: str, like: Optional[str] = None, not_like: Optional[str] = None
-) -> List[Table]:
+    database: str,
+    like: Optional[str] = None,
+    not_like: Optional[str] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> List[Table] | dict:
     """List all tables in a database for exploration and discovery.
 
     Use this tool to:
@@ -529,8 +541,24 @@ async def list_tables(
 
         # Step 4: Execute query
         result = await run_select_query("SELECT countMerge(`count()`) FROM akamai.summary LIMIT 100")
+
+    PAGINATION (optional): For databases with many tables, pass page_size to page through
+    results. Paginated calls return {"tables": [...], "next_cursor": ...} instead of a bare
+    list; pass next_cursor back (with the SAME database and like/not_like filters - the
+    offset is only meaningful against one filtered listing) to fetch the following page.
+    next_cursor is null on the last page. Cursors are opaque - do not construct or edit them.
     """
     logger.info(f"Listing tables in database '{database}'")
+
+    offset = 0
+    if cursor is not None:
+        try:
+            cursor_data = TableListCursor.decode(cursor)
+            cursor_data.validate_params(database, like, not_like)
+        except ValueError as e:
+            raise ToolError(f"Invalid cursor: {e}")
+        offset = cursor_data.offset
+
     query = f"""
         SELECT {SYSTEM_TABLES_FIELDS}
         FROM system.tables WHERE database = {format_query_value(database)}"""
@@ -540,6 +568,12 @@ async def list_tables(
     if not_like:
         query += f" AND name NOT LIKE {format_query_value(not_like)}"
 
+    paginated = page_size is not None or cursor is not None
+    if paginated:
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        # Deterministic order so pages are stable across requests
+        query += f" ORDER BY name LIMIT {page_size} OFFSET {offset}"
+
     result = await execute_query(query)
 
     # Deserialize result as Table dataclass instances (without column metadata)
@@ -552,12 +586,27 @@ async def list_tables(
     logger.info(
         f"Found {len(tables)} tables (columns not populated - use get_table_info for schema)"
     )
-    return tables
+
+    if not paginated:
+        return tables
+
+    next_cursor = None
+    if len(tables) == page_size:
+        next_cursor = TableListCursor(
+            offset=offset + page_size,
+            database=database,
+            filter_hash=hash_table_filters(like, not_like),
+        ).encode()
+    return {"tables": tables, "next_cursor": next_cursor}
 
 
 @mcp.tool()
 @with_serializer
-async def run_select_query(query: str) -> dict[str, tuple | Sequence[str | Sequence[Any]]]:
+async def run_select_query(
+    query: str,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict[str, tuple | Sequence[str | Sequence[Any]]]:
     """Run a SELECT query in a Hydrolix time-series database using the Clickhouse SQL dialect.
     Queries run using this tool will timeout after 30 seconds.
 
@@ -738,11 +787,42 @@ async def run_select_query(query: str) -> dict[str, tuple | Sequence[str | Seque
     table in the window between new year and valentine's day of 2024. Primary key: `timestamp`.
     Performance guard: date range filter.
      `SELECT app, count(*) FROM application.logs WHERE timestamp > '2024-01-01' AND timestamp < '2024-02-14' GROUP BY app ORDER BY count(*) DESC LIMIT 1`
+
+    PAGINATION (optional): Pass page_size to fetch results one page at a time. When a full
+    page is returned, the result includes a next_cursor; pass it back (with the SAME query
+    string) to fetch the next page. Cursors are opaque and bound to the query that produced
+    them - do not construct or edit them, and do not reuse them with a different query.
     """
     logger.info(f"Executing SELECT query: {query}")
+
+    offset = 0
+    if cursor is not None:
+        try:
+            cursor_data = QueryResultCursor.decode(cursor)
+            cursor_data.validate_params(query)
+        except ValueError as e:
+            raise ToolError(f"Invalid cursor: {e}")
+        offset = cursor_data.offset
+
+    paginated = page_size is not None or cursor is not None
+    if paginated:
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        query_to_run = _add_pagination_to_query(query, page_size, offset)
+    else:
+        query_to_run = query
+
     try:
-        result = await execute_query(query=query)
-        return result
+        result = await execute_query(query=query_to_run)
     except Exception as e:
         logger.error(f"Unexpected error in run_select_query: {str(e)}")
         raise ToolError(f"Unexpected error during query execution: {str(e)}")
+
+    if not paginated:
+        return result
+
+    next_cursor = None
+    if len(result["rows"]) == page_size:
+        next_cursor = QueryResultCursor(
+            offset=offset + page_size, query_hash=hash_query(query)
+        ).encode()
+    return dict(result, next_cursor=next_cursor)
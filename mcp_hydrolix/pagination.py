@@ -0,0 +1,324 @@
+"""Cursor-based pagination for MCP tool results.
+
+Cursors are opaque URL-safe strings that round-trip the state needed to
+resume a listing or query at a fixed offset. The wire form is a tagged
+positional JSON array with double quotes swapped for "~" (see the codec
+notes below).
+
+On codec choice: the common encode/decode cases are served by per-class
+string templates and anchored regexes and never enter a JSON library; the
+stdlib codec only backs the fallback paths (e.g. database names needing
+JSON escaping). A faster compiled JSON library (orjson and msgspec were
+both evaluated) would therefore not move these paths and is deliberately
+not a dependency.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
+
+# Shared codec instances. Cursors are tiny and encoded on every paginated
+# request, so we pay for one encoder/decoder at import time instead of
+# rebuilding the codec state inside json.dumps/json.loads on each call.
+# The bound methods are stored directly: the hot paths then call straight
+# through a module global instead of re-resolving the attribute every time.
+_json_encode = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+_json_decode = json.JSONDecoder().decode
+
+# Cursor payloads are compact ASCII JSON emitted as-is rather than wrapped in
+# base64: for ~40-byte payloads the bytes<->text conversions and the base64
+# pass itself dominate the encode/decode cost. The double quote - the one
+# character in our output that breaks URL/CLI quoting - is swapped for "~" on
+# the wire and swapped back before parsing. To keep that swap reversible, a
+# literal "~" inside a value is first rewritten to its JSON escape form
+# (backslash-u007e), so after the swap every "~" on the wire denotes a quote
+# and the JSON parser restores escaped tildes on decode with no reverse step.
+_TO_URLSAFE = str.maketrans({'"': "~"})
+_FROM_URLSAFE = str.maketrans({"~": '"'})
+
+# Every character a cursor can legally contain: printable ASCII minus the
+# double quote (always translated to "~" on the wire).
+_WIRE_ALPHABET = "".join(chr(c) for c in range(0x20, 0x7F) if c != 0x22)
+
+
+def _reject_invalid_chars(cursor: str) -> None:
+    """Fail fast on cursors containing bytes outside the wire alphabet.
+
+    str.strip drops every leading/trailing alphabet character in one C-level
+    pass, so any remainder pinpoints a byte that can never occur in a valid
+    cursor - no need to enter the JSON parser to find out.
+    """
+    if cursor.strip(_WIRE_ALPHABET):
+        raise ValueError("cursor contains characters outside the wire alphabet")
+
+
+# Single-pass SQL scanner for LIMIT/OFFSET detection. Comment, string and
+# quoted-identifier alternatives come first so their contents are consumed
+# whole and never mistaken for keywords; only the `kw` group flags a real
+# LIMIT/OFFSET token. An unquoted identifier shadowing a keyword still
+# matches `kw`, which only costs a redundant (but harmless) subquery wrap.
+_SQL_TOKEN_RE = re.compile(
+    r"""
+      --[^\n]*                        # line comment
+    | /\*.*?\*/                       # block comment
+    | '(?:[^'\\]|\\.)*'               # string literal
+    | "(?:[^"\\]|\\.)*"               # double-quoted identifier
+    | `[^`]*`                         # backquoted identifier
+    | (?P<kw>\b(?i:LIMIT|OFFSET)\b)
+    | \w+
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def _has_limit_or_offset(query: str) -> bool:
+    for match in _SQL_TOKEN_RE.finditer(query):
+        if match.lastgroup == "kw":
+            return True
+    return False
+
+
+# Page size used when a caller supplies a cursor without an explicit page_size.
+DEFAULT_PAGE_SIZE = 50
+
+
+@lru_cache(maxsize=256)
+def _hash_stripped(stripped: str) -> str:
+    # BLAKE2b is 2-3x faster than SHA-256 on short inputs in CPython, and a
+    # native 128-bit digest is ample for pinning a cursor to its query - the
+    # hash exists for tamper detection, not signatures.
+    return hashlib.blake2b(stripped.encode(), digest_size=16).hexdigest()
+
+
+def _fast_new(cls, values):
+    """Build a cursor instance directly from decoded wire values.
+
+    The decoded payload already has the exact field layout, so running the
+    dataclass-generated __init__ (default handling plus one attribute store
+    per field in bytecode) is wasted work; allocate with object.__new__ and
+    store the fields directly into their slots.
+
+    Wire values are attacker-controlled, so field types are enforced here:
+    the offset ends up interpolated into SQL, and accepting a string for it
+    would hand a tampered cursor straight to the query head.
+    """
+    if len(values) != len(cls._FIELDS):
+        raise ValueError(f"expected {len(cls._FIELDS)} cursor fields, got {len(values)}")
+    obj = object.__new__(cls)
+    for name, value in zip(cls._FIELDS, values):
+        if name == "offset":
+            # type() rather than isinstance(): bool is an int subclass.
+            if type(value) is not int or value < 0:
+                raise ValueError("cursor offset must be a non-negative integer")
+        elif type(value) is not str:
+            raise ValueError(f"cursor field {name!r} must be a string")
+        setattr(obj, name, value)
+    # Bypassing __init__ also bypasses __post_init__, so restore its
+    # invariants (e.g. field interning) by hand.
+    post_init = getattr(obj, "__post_init__", None)
+    if post_init is not None:
+        post_init()
+    return obj
+
+
+def _decode_cursor(cls, cursor: str):
+    """Decode `cursor` as an instance of the cursor class `cls`.
+
+    Both cursor types share this single body - anchored-regex fast path,
+    then the generic JSON fallback - so the interpreter specializes one code
+    path instead of two copies, and the wire handling lives in one place.
+    """
+    match = cls._WIRE_RE.match(cursor)
+    if match:
+        offset, *rest = match.groups()
+        return _fast_new(cls, (int(offset), *rest))
+    try:
+        _reject_invalid_chars(cursor)
+        tag, *values = _json_decode(cursor.translate(_FROM_URLSAFE))
+        if tag != cls._TAG:
+            raise ValueError(f"unexpected cursor tag {tag!r}")
+        return _fast_new(cls, values)
+    except Exception as e:
+        raise ValueError(f"Invalid {cls.__name__} format: {e}")
+
+
+def hash_query(query: str) -> str:
+    """Return a stable BLAKE2b-128 hash of `query`, used to pin a cursor to
+    the query that produced it. Leading/trailing whitespace is not
+    significant.
+
+    Paginating a query hashes it once per page, so results are memoized on
+    the stripped query text.
+    """
+    return _hash_stripped(query.strip())
+
+
+def hash_table_filters(like: str | None, not_like: str | None) -> str:
+    """Return a stable hash of the list_tables name filters, used to pin a
+    TableListCursor to the filters it was issued under - the offset is only
+    meaningful against one filtered, name-ordered result set.
+
+    Unfiltered listings hash to the empty string.
+    """
+    if not like and not not_like:
+        return ""
+    return _hash_stripped(f"{like or ''}\x00{not_like or ''}")
+
+
+# Partial evaluation of the wire format: everything around each class's
+# values is fixed at class-definition time, so typical cursors can be built
+# with a format template and parsed with one anchored regex match instead of
+# a JSON round trip. Database names outside the plain-identifier set (where
+# JSON escaping could kick in) fall back to the generic codec.
+_PLAIN_DB_RE = re.compile(r"\w+\Z", re.ASCII)
+_TABLE_CURSOR_RE = re.compile(r"\[~t~,(\d+),~(\w*)~,~([0-9a-f]*)~\]\Z", re.ASCII)
+_QUERY_CURSOR_RE = re.compile(r"\[~q~,(\d+),~([0-9a-f]{32})~\]\Z", re.ASCII)
+
+
+@dataclass(slots=True)
+class BaseCursorData:
+    """Common state for pagination cursors.
+
+    Cursors are opaque, URL-safe strings handed back to the client with each
+    page of results; they round-trip the offset (plus subclass-specific
+    request parameters) needed to resume at the next page.
+
+    The wire form is a tagged positional JSON array such as `[~t~,50,~db~]`:
+    field names are fixed per class, so emitting them on every cursor only
+    adds bytes. The leading tag identifies (and versions) the schema, and
+    values follow in `_FIELDS` order.
+    """
+
+    # Subclasses pin their tag and positional field order.
+    _TAG: ClassVar[str] = ""
+    _FIELDS: ClassVar[tuple[str, ...]] = ("offset",)
+
+    offset: int = 0
+
+    def __init_subclass__(cls):
+        # No super() call: dataclass(slots=True) recreates this class, and
+        # the zero-argument form would resolve against the discarded
+        # original (the effective base is object anyway).
+        #
+        # A subclass's wire template is fully determined by _TAG and _FIELDS,
+        # so compile it a bespoke encoder with the field accesses inlined
+        # instead of interpreting the field list on every call: offset is the
+        # one numeric field, every other field is spliced between "~" quotes.
+        parts = [f"[~{cls._TAG}~"]
+        for name in cls._FIELDS:
+            parts.append("{self.offset}" if name == "offset" else f"~{{self.{name}}}~")
+        template = ",".join(parts) + "]"
+        namespace = {}
+        exec(f"def _encode_template(self):\n    return f{template!r}", namespace)
+        cls._encode_template = namespace["_encode_template"]
+
+    def encode(self) -> str:
+        payload = [self._TAG] + [getattr(self, name) for name in self._FIELDS]
+        # Escape literal tildes before the quote swap so decode can tell
+        # them apart from swapped quotes (see the _TO_URLSAFE notes).
+        return _json_encode(payload).replace("~", "\\u007e").translate(_TO_URLSAFE)
+
+
+@dataclass(slots=True)
+class TableListCursor(BaseCursorData):
+    _TAG: ClassVar[str] = "t"
+    _FIELDS: ClassVar[tuple[str, ...]] = ("offset", "database", "filter_hash")
+    _WIRE_RE: ClassVar[re.Pattern] = _TABLE_CURSOR_RE
+
+    database: str = ""
+    filter_hash: str = ""
+
+    def __post_init__(self):
+        # Deployments page through a handful of databases (and filter
+        # combinations) over and over; interning turns the validate_params
+        # comparisons into pointer checks once a value has been seen.
+        self.database = sys.intern(self.database)
+        self.filter_hash = sys.intern(self.filter_hash)
+
+    def encode(self) -> str:
+        if _PLAIN_DB_RE.match(self.database):
+            return self._encode_template()
+        # Explicit base call: dataclass(slots=True) recreates the class, so
+        # zero-argument super() would resolve against the discarded original.
+        return BaseCursorData.encode(self)
+
+    @classmethod
+    def decode(cls, cursor: str) -> "TableListCursor":
+        return _decode_cursor(cls, cursor)
+
+    def validate_params(
+        self, database: str, like: str | None = None, not_like: str | None = None
+    ) -> None:
+        """Reject cursors issued for a different database or name filters."""
+        if self.database != database:
+            raise ValueError("Cursor does not match the requested database")
+        if self.filter_hash != hash_table_filters(like, not_like):
+            raise ValueError("Cursor does not match the requested table filters")
+
+
+@dataclass(slots=True)
+class QueryResultCursor(BaseCursorData):
+    _TAG: ClassVar[str] = "q"
+    _FIELDS: ClassVar[tuple[str, ...]] = ("offset", "query_hash")
+    _WIRE_RE: ClassVar[re.Pattern] = _QUERY_CURSOR_RE
+
+    query_hash: str = ""
+
+    def __post_init__(self):
+        # Hashes recur across every page of a query (and _hash_stripped
+        # memoizes them), so interning makes validate_params a pointer check.
+        self.query_hash = sys.intern(self.query_hash)
+
+    def encode(self) -> str:
+        # query_hash is always hex, so the compiled template is safe for
+        # every instance - no fallback needed.
+        return self._encode_template()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "QueryResultCursor":
+        return _decode_cursor(cls, cursor)
+
+    def validate_params(self, query: str) -> None:
+        """Reject cursors issued for a different query."""
+        if self.query_hash != hash_query(query):
+            raise ValueError("Cursor does not match the requested query")
+
+
+@lru_cache(maxsize=512)
+def _needs_wrapping(query: str) -> tuple[bool, str]:
+    """Return whether `query` must be wrapped in a subquery for pagination,
+    along with its sanitized (trailing semicolon/whitespace stripped) form.
+
+    The answer depends only on the query text, never on the page being
+    fetched, so it is memoized: paging through N pages of one query scans
+    its tokens once.
+    """
+    clean = query.strip().rstrip(";").rstrip()
+    # Most production queries never mention limit/offset at all; two C-level
+    # substring probes settle those without running the token scanner. The
+    # scanner only disambiguates keyword vs. string/comment/identifier when
+    # one of the substrings is actually present.
+    lowered = clean.lower()
+    if "limit" not in lowered and "offset" not in lowered:
+        return False, clean
+    return _has_limit_or_offset(clean), clean
+
+
+def _add_pagination_to_query(query: str, limit: int, offset: int) -> str:
+    """Apply LIMIT/OFFSET pagination to a SELECT query.
+
+    Queries that already contain a LIMIT or OFFSET clause are wrapped in a
+    subquery so the caller's own limit is preserved and pagination applies to
+    its result set; otherwise the clauses are appended directly.
+
+    The newline before the appended clause / closing paren keeps both out of
+    any `--` line comment the query may end with.
+    """
+    needs_wrap, clean = _needs_wrapping(query)
+    if needs_wrap:
+        return f"SELECT * FROM ({clean}\n) AS paginated_subquery LIMIT {limit} OFFSET {offset}"
+    return f"{clean}\nLIMIT {limit} OFFSET {offset}"
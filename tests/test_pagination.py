@@ -0,0 +1,295 @@
+import pytest
+
+from mcp_hydrolix.pagination import (
+    BaseCursorData,
+    QueryResultCursor,
+    TableListCursor,
+    _add_pagination_to_query,
+    hash_query,
+    hash_table_filters,
+)
+
+
+class TestHashQuery:
+    """Test suite for hash_query."""
+
+    def test_query_hash_is_blake2b_128(self):
+        """Test that the hash is a 128-bit BLAKE2b hex digest."""
+        result = hash_query("SELECT 1")
+        assert len(result) == 32
+        assert all(c in "0123456789abcdef" for c in result)
+
+    def test_query_hash_is_deterministic(self):
+        """Test that the same query always hashes to the same value."""
+        assert hash_query("SELECT 1") == hash_query("SELECT 1")
+
+    def test_query_hash_ignores_surrounding_whitespace(self):
+        """Test that leading/trailing whitespace does not change the hash."""
+        assert hash_query("  SELECT 1 \n") == hash_query("SELECT 1")
+
+    def test_query_hash_differs_for_different_queries(self):
+        """Test that different queries produce different hashes."""
+        assert hash_query("SELECT 1") != hash_query("SELECT 2")
+
+
+class TestTableListCursor:
+    """Test suite for TableListCursor encode/decode."""
+
+    def test_roundtrip(self):
+        """Test that encode/decode preserves cursor fields."""
+        cursor = TableListCursor(offset=50, database="test_db")
+        decoded = TableListCursor.decode(cursor.encode())
+        assert decoded.offset == 50
+        assert decoded.database == "test_db"
+
+    def test_roundtrip_with_filter_hash(self):
+        """Test that the filter hash round-trips with the cursor."""
+        filter_hash = hash_table_filters("t%", None)
+        cursor = TableListCursor(offset=50, database="test_db", filter_hash=filter_hash)
+        decoded = TableListCursor.decode(cursor.encode())
+        assert decoded.filter_hash == filter_hash
+
+    def test_encoded_cursor_is_url_safe(self):
+        """Test that encoded cursors contain no URL-unsafe characters."""
+        encoded = TableListCursor(offset=100, database="some_database").encode()
+        assert "+" not in encoded
+        assert "/" not in encoded
+        assert "=" not in encoded
+        assert '"' not in encoded
+
+    def test_roundtrip_with_non_identifier_database(self):
+        """Test that database names outside the fast-path alphabet still round-trip."""
+        cursor = TableListCursor(offset=3, database="my-db.v2")
+        decoded = TableListCursor.decode(cursor.encode())
+        assert decoded.offset == 3
+        assert decoded.database == "my-db.v2"
+
+    def test_roundtrip_with_tilde_in_database(self):
+        """Test that a literal tilde in the database name survives the quote swap."""
+        cursor = TableListCursor(offset=2, database="a~b")
+        encoded = cursor.encode()
+        decoded = TableListCursor.decode(encoded)
+        assert decoded.offset == 2
+        assert decoded.database == "a~b"
+
+    def test_roundtrip_with_quote_in_database(self):
+        """Test that a double quote in the database name round-trips."""
+        cursor = TableListCursor(offset=0, database='we"ird')
+        decoded = TableListCursor.decode(cursor.encode())
+        assert decoded.database == 'we"ird'
+
+    def test_encode_matches_generic_wire_format(self):
+        """Test that the specialized encoder emits the generic wire form."""
+        cursor = TableListCursor(offset=9, database="plain_db")
+        assert cursor.encode() == BaseCursorData.encode(cursor)
+
+    def test_validate_params_accepts_matching_database(self):
+        """Test that validation passes when the database matches."""
+        cursor = TableListCursor(offset=0, database="db")
+        cursor.validate_params("db")
+
+    def test_validate_params_rejects_other_database(self):
+        """Test that a cursor issued for another database is rejected."""
+        cursor = TableListCursor(offset=0, database="db")
+        with pytest.raises(ValueError):
+            cursor.validate_params("other_db")
+
+    def test_validate_params_accepts_matching_filters(self):
+        """Test that validation passes when the name filters match."""
+        cursor = TableListCursor(
+            offset=0, database="db", filter_hash=hash_table_filters("t%", "x%")
+        )
+        cursor.validate_params("db", like="t%", not_like="x%")
+
+    def test_validate_params_rejects_changed_filters(self):
+        """Test that a cursor issued under different name filters is rejected."""
+        cursor = TableListCursor(
+            offset=0, database="db", filter_hash=hash_table_filters("t%", None)
+        )
+        with pytest.raises(ValueError):
+            cursor.validate_params("db", like="other%")
+
+    def test_validate_params_rejects_dropped_filters(self):
+        """Test that a filtered cursor is rejected for an unfiltered listing."""
+        cursor = TableListCursor(
+            offset=0, database="db", filter_hash=hash_table_filters("t%", None)
+        )
+        with pytest.raises(ValueError):
+            cursor.validate_params("db")
+
+    def test_decoded_database_is_interned(self):
+        """Test that decode preserves the __post_init__ interning invariant."""
+        import sys
+
+        decoded = TableListCursor.decode(TableListCursor(offset=0, database="some_db").encode())
+        assert decoded.database is sys.intern("some_db")
+
+    def test_decode_rejects_garbage(self):
+        """Test that non-cursor input raises ValueError."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("not a cursor!!!")
+
+    def test_decode_rejects_non_json_payload(self):
+        """Test that a well-formed-looking but non-JSON payload is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("hello-world")
+
+    def test_decode_rejects_unexpected_fields(self):
+        """Test that a payload with extra positional fields is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,1,~db~,99]")
+
+    def test_decode_rejects_wrong_tag(self):
+        """Test that a cursor of another type is rejected by its tag."""
+        encoded = QueryResultCursor(offset=0, query_hash=hash_query("SELECT 1")).encode()
+        with pytest.raises(ValueError):
+            TableListCursor.decode(encoded)
+
+    def test_decode_rejects_string_offset(self):
+        """Test that a tampered cursor smuggling SQL in the offset is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,~0 UNION SELECT 1~,~db~]")
+
+    def test_decode_rejects_float_offset(self):
+        """Test that a non-integer offset is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,1.5,~db~]")
+
+    def test_decode_rejects_negative_offset(self):
+        """Test that a negative offset is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,-1,~db~]")
+
+    def test_decode_rejects_boolean_offset(self):
+        """Test that a JSON boolean offset is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,true,~db~]")
+
+    def test_decode_rejects_non_string_database(self):
+        """Test that a non-string database field is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,1,2]")
+
+    def test_decode_rejects_non_ascii_input(self):
+        """Test that input outside the wire alphabet is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,1,~düb~]")
+
+    def test_decode_rejects_control_characters(self):
+        """Test that embedded control characters are rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("[~t~,1,\x00~db~]")
+
+    def test_decode_rejects_empty_string(self):
+        """Test that an empty cursor string is rejected."""
+        with pytest.raises(ValueError):
+            TableListCursor.decode("")
+
+
+class TestQueryResultCursor:
+    """Test suite for QueryResultCursor encode/decode."""
+
+    def test_roundtrip(self):
+        """Test that encode/decode preserves cursor fields."""
+        cursor = QueryResultCursor(offset=200, query_hash=hash_query("SELECT 1"))
+        decoded = QueryResultCursor.decode(cursor.encode())
+        assert decoded.offset == 200
+        assert decoded.query_hash == hash_query("SELECT 1")
+
+    def test_validate_params_accepts_matching_query(self):
+        """Test that validation passes for the originating query."""
+        cursor = QueryResultCursor(offset=0, query_hash=hash_query("SELECT 1"))
+        cursor.validate_params("SELECT 1")
+
+    def test_validate_params_rejects_other_query(self):
+        """Test that a cursor issued for another query is rejected."""
+        cursor = QueryResultCursor(offset=0, query_hash=hash_query("SELECT 1"))
+        with pytest.raises(ValueError):
+            cursor.validate_params("SELECT 2")
+
+    def test_decode_rejects_garbage(self):
+        """Test that non-cursor input raises ValueError."""
+        with pytest.raises(ValueError):
+            QueryResultCursor.decode("@@@not-a-cursor@@@")
+
+    def test_encode_matches_generic_wire_format(self):
+        """Test that the specialized encoder emits the generic wire form."""
+        cursor = QueryResultCursor(offset=7, query_hash=hash_query("SELECT 1"))
+        assert cursor.encode() == BaseCursorData.encode(cursor)
+
+
+class TestAddPaginationToQuery:
+    """Test suite for _add_pagination_to_query."""
+
+    def test_appends_limit_offset(self):
+        """Test that plain queries get LIMIT/OFFSET appended."""
+        result = _add_pagination_to_query("SELECT a FROM t", 10, 20)
+        assert result == "SELECT a FROM t\nLIMIT 10 OFFSET 20"
+
+    def test_strips_trailing_semicolon(self):
+        """Test that a trailing semicolon is removed before appending."""
+        result = _add_pagination_to_query("SELECT a FROM t;", 10, 0)
+        assert result == "SELECT a FROM t\nLIMIT 10 OFFSET 0"
+
+    def test_strips_surrounding_whitespace(self):
+        """Test that surrounding whitespace is removed before appending."""
+        result = _add_pagination_to_query("  SELECT a FROM t ; ", 5, 0)
+        assert result == "SELECT a FROM t\nLIMIT 5 OFFSET 0"
+
+    def test_wraps_query_with_limit(self):
+        """Test that a query with its own LIMIT is wrapped in a subquery."""
+        result = _add_pagination_to_query("SELECT a FROM t LIMIT 5", 10, 20)
+        assert result == (
+            "SELECT * FROM (SELECT a FROM t LIMIT 5\n) AS paginated_subquery LIMIT 10 OFFSET 20"
+        )
+
+    def test_wraps_query_with_offset(self):
+        """Test that a query with its own OFFSET is wrapped in a subquery."""
+        result = _add_pagination_to_query("SELECT a FROM t LIMIT 5 OFFSET 1", 10, 0)
+        assert result == (
+            "SELECT * FROM (SELECT a FROM t LIMIT 5 OFFSET 1\n) AS paginated_subquery"
+            " LIMIT 10 OFFSET 0"
+        )
+
+    def test_wraps_lowercase_limit(self):
+        """Test that LIMIT detection is case-insensitive."""
+        result = _add_pagination_to_query("select a from t limit 5", 10, 0)
+        assert result.startswith("SELECT * FROM (")
+
+    def test_limit_in_string_literal_is_not_wrapped(self):
+        """Test that LIMIT inside a string literal is not treated as a keyword."""
+        result = _add_pagination_to_query("SELECT a FROM t WHERE b = 'no limit here'", 10, 0)
+        assert result == "SELECT a FROM t WHERE b = 'no limit here'\nLIMIT 10 OFFSET 0"
+
+    def test_limit_in_block_comment_is_not_wrapped(self):
+        """Test that LIMIT inside a block comment is not treated as a keyword."""
+        result = _add_pagination_to_query("SELECT a /* apply limit later */ FROM t", 10, 0)
+        assert result == "SELECT a /* apply limit later */ FROM t\nLIMIT 10 OFFSET 0"
+
+    def test_limit_in_backquoted_identifier_is_not_wrapped(self):
+        """Test that LIMIT inside a backquoted identifier is not treated as a keyword."""
+        result = _add_pagination_to_query("SELECT `limit` FROM t", 10, 0)
+        assert result == "SELECT `limit` FROM t\nLIMIT 10 OFFSET 0"
+
+    def test_limit_in_double_quoted_identifier_is_not_wrapped(self):
+        """Test that LIMIT inside a double-quoted identifier is not treated as a keyword."""
+        result = _add_pagination_to_query('SELECT "limit" FROM t', 10, 0)
+        assert result == 'SELECT "limit" FROM t\nLIMIT 10 OFFSET 0'
+
+    def test_limit_prefixed_identifier_is_not_wrapped(self):
+        """Test that identifiers merely containing 'limit' are not treated as keywords."""
+        result = _add_pagination_to_query("SELECT limited, offsets FROM t", 10, 0)
+        assert result == "SELECT limited, offsets FROM t\nLIMIT 10 OFFSET 0"
+
+    def test_appended_clause_survives_trailing_line_comment(self):
+        """Test that appending after a trailing line comment keeps LIMIT outside it."""
+        result = _add_pagination_to_query("SELECT a FROM t -- note", 10, 20)
+        assert result == "SELECT a FROM t -- note\nLIMIT 10 OFFSET 20"
+
+    def test_wrapped_query_survives_trailing_line_comment(self):
+        """Test that wrapping a query ending in a line comment keeps the paren outside it."""
+        result = _add_pagination_to_query("SELECT a FROM t LIMIT 5 -- note", 10, 0)
+        assert result == (
+            "SELECT * FROM (SELECT a FROM t LIMIT 5 -- note\n) AS paginated_subquery"
+            " LIMIT 10 OFFSET 0"
+        )